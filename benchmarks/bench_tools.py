@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+import argparse
+import importlib.util
+import json
+import os
+import random
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BASE_DIR)
+WEEK1_DIR = os.path.join(REPO_DIR, "week1_assignments")
+COCOTB_DIR = os.path.join(REPO_DIR, "cocotb")
+HISTORY_JSON = os.path.join(BASE_DIR, "history.json")
+
+# Rough size of upstream riscv-opcodes: ~100 files in extensions/ holding
+# ~1100 instruction lines and a few hundred $pseudo_op lines.
+UPSTREAM_FILES = 100
+LINES_PER_FILE = 11
+PSEUDO_PER_FILE = 3
+SCALES = [1, 10, 100]
+
+# A run regresses if a metric is this much worse than the baseline, which
+# is the median of the last BASELINE_RUNS saved runs. Until a metric has
+# that many saved values, its comparison is reported but not enforced.
+DEFAULT_THRESHOLD = 0.20
+BASELINE_RUNS = 5
+
+# Changes smaller than NOISE_MADS times the median absolute deviation of
+# the baseline runs are treated as noise.
+NOISE_MADS = 3
+
+# Each timed sample loops the call until it has run for at least this long,
+# so millisecond-scale 1x metrics aren't dominated by timer and cache jitter.
+MIN_SAMPLE_TIME = 0.1
+
+# cocotb tests to run; each logs "<n> vectors checked" when it finishes.
+COCOTB_TESTS = ["mul", "alu"]
+VECTORS_RE = re.compile(r"(\d+) vectors checked")
+
+def load_module(name, relpath):
+    """Import a week1 script by path (the assignment folders are not packages)."""
+    spec = importlib.util.spec_from_file_location(name, os.path.join(WEEK1_DIR, relpath))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+print_opcodes = load_module("print_opcodes", "week1_assignment1/print_opcodes.py")
+search_op = load_module("search_op", "week1_assignment2/search_op.py")
+count_extensions = load_module("count_extensions", "week1_assignment3/count_extensions.py")
+list_combinations = load_module("list_combinations", "week1_assignment4/list_combinations.py")
+opcode_frequencies = load_module("opcode_frequencies", "week1_assignment5/opcode_frequencies.py")
+detect_conflicts = load_module("detect_conflicts", "week1_assignment6/detect_conflicts.py")
+
+def make_tree(path, scale, seed=0):
+    """Write a synthetic riscv-opcodes tree (extensions/) at `scale` x upstream size."""
+    rng = random.Random(seed)
+    ext_dir = os.path.join(path, "extensions")
+    os.makedirs(ext_dir)
+    for n in range(UPSTREAM_FILES * scale):
+        ext = f"rv{rng.choice(['', '32', '64'])}_x{n}"
+        lines = [f"# synthetic extension {ext}", ""]
+        for k in range(LINES_PER_FILE):
+            lines.append(
+                f"{ext}_op{k} rd rs1 rs2 31..25={rng.randrange(128)} "
+                f"14..12={rng.randrange(8)} 6..2=0x{rng.randrange(32):02x} 1..0=3"
+            )
+        for k in range(PSEUDO_PER_FILE):
+            lines.append(
+                f"$pseudo_op {ext}::{ext}_op{k} {ext}_ps{k} rd rs1 shamtw "
+                f"31..25={rng.randrange(128)} 14..12={rng.randrange(8)} "
+                f"6..2=0x{rng.randrange(32):02x} 1..0=3"
+            )
+        with open(os.path.join(ext_dir, ext), "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+    return ext_dir
+
+def sample(fn):
+    """Per-call wall-clock time of `fn`, looped for at least MIN_SAMPLE_TIME."""
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        fn()
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= MIN_SAMPLE_TIME:
+            return elapsed / calls
+
+def timed(fns, repeat):
+    """Best per-call time of each function over `repeat` samples, in seconds.
+
+    Samples are taken round-robin across all functions so that a slow
+    stretch on the machine hits every metric a little rather than one a lot.
+    """
+    best = {}
+    for _ in range(repeat):
+        for name, fn in fns.items():
+            t = sample(fn)
+            best[name] = min(best.get(name, t), t)
+    return best
+
+def bench_tools(ext_dir, repeat):
+    """Time each week1 tool against one synthetic extensions/ directory."""
+    files = [os.path.join(ext_dir, f) for f in os.listdir(ext_dir)]
+
+    def search_all():
+        for fpath in files:
+            search_op.search_in_file(fpath, "add")
+
+    def count_all():
+        count_extensions.EXT_DIR = ext_dir
+        count_extensions.parse_extensions_dir(count_extensions.Counter())
+
+    def combinations():
+        list_combinations.EXT_DIR = ext_dir
+        list_combinations.parse_pseudo_ops()
+
+    def frequencies():
+        opcode_frequencies.EXT_DIR = ext_dir
+        opcode_frequencies.parse_pseudo_ops()
+
+    # Parse once up front so find_conflicts times only the bucketed comparison.
+    encodings = detect_conflicts.collect_encodings(os.path.dirname(ext_dir))
+
+    def conflicts():
+        detect_conflicts.find_conflicts(encodings)
+
+    return timed({
+        "collect_opcodes": lambda: print_opcodes.collect_opcodes(ext_dir),
+        "search_in_file": search_all,
+        "parse_extensions_dir": count_all,
+        "list_combinations.parse_pseudo_ops": combinations,
+        "opcode_frequencies.parse_pseudo_ops": frequencies,
+        "find_conflicts": conflicts,
+    }, repeat)
+
+def cocotb_available():
+    return shutil.which("cocotb-config") is not None and shutil.which("iverilog") is not None
+
+def bench_cocotb(name, repeat):
+    """Run one cocotb test `repeat` times and return its best vectors per second.
+
+    The vector count is taken from the test's own log. Raises RuntimeError
+    if make fails, so a broken harness isn't mistaken for a missing simulator.
+    """
+    test_dir = os.path.join(COCOTB_DIR, name)
+    best = None
+    with tempfile.TemporaryDirectory() as tmp:
+        results = os.path.join(tmp, "results.xml")
+        # The Makefiles build paths from $(PWD), which make inherits from us.
+        env = dict(os.environ, PWD=test_dir, COCOTB_RESULTS_FILE=results,
+                   SIM_BUILD=os.path.join(tmp, "sim_build"))
+        for _ in range(repeat):
+            proc = subprocess.run(["make"], cwd=test_dir, env=env,
+                                  stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+            if proc.returncode != 0 or not os.path.isfile(results):
+                tail = "\n".join(proc.stdout.splitlines()[-20:])
+                raise RuntimeError(f"make in {test_dir} failed (exit {proc.returncode}):\n{tail}")
+            vectors = sum(int(n) for n in VECTORS_RE.findall(proc.stdout))
+            if not vectors:
+                raise RuntimeError(f"{name} test did not log a '<n> vectors checked' count")
+            # Use cocotb's own per-test wall time so simulator build/startup is excluded.
+            total = sum(float(tc.get("time", 0)) for tc in ET.parse(results).iter("testcase"))
+            os.remove(results)
+            if total:
+                rate = vectors / total
+                best = rate if best is None else max(best, rate)
+    return best
+
+def run(scales, repeat, cocotb=True):
+    results = {}
+    for scale in scales:
+        with tempfile.TemporaryDirectory() as tmp:
+            ext_dir = make_tree(tmp, scale)
+            for tool, secs in bench_tools(ext_dir, repeat).items():
+                results[f"{tool}@{scale}x"] = {"value": secs, "unit": "s", "lower_is_better": True}
+    failures = []
+    if cocotb and cocotb_available():
+        for name in COCOTB_TESTS:
+            try:
+                rate = bench_cocotb(name, repeat)
+            except RuntimeError as err:
+                failures.append(str(err))
+                continue
+            if rate is not None:
+                results[f"cocotb/{name}"] = {"value": rate, "unit": "vectors/s", "lower_is_better": False}
+    return results, failures
+
+def git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_DIR,
+                             capture_output=True, text=True)
+        return out.stdout.strip() or None
+    except OSError:
+        return None
+
+def load_history(path):
+    if not os.path.isfile(path):
+        return []
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def baseline(history, runs=BASELINE_RUNS):
+    """(median, median absolute deviation, count) of each metric over the last `runs` saved runs."""
+    values = {}
+    for entry in history[-runs:]:
+        for metric, r in entry["results"].items():
+            values.setdefault(metric, []).append(r["value"])
+    base = {}
+    for metric, v in values.items():
+        median = statistics.median(v)
+        base[metric] = (median, statistics.median(abs(x - median) for x in v), len(v))
+    return base
+
+def confirm(results, regressions, repeat):
+    """Re-measure the scales and tests that regressed, keeping the better value.
+
+    A real slowdown shows up again; a one-off stall on the machine doesn't.
+    """
+    metrics = [metric for metric, *_, enforced in regressions if enforced]
+    scales = sorted({int(m.rsplit("@", 1)[1].rstrip("x")) for m in metrics if "@" in m})
+    cocotb = any(m.startswith("cocotb/") for m in metrics)
+    rerun, _ = run(scales, repeat, cocotb=cocotb)
+    for metric, r in rerun.items():
+        if metric in results:
+            better = min if r["lower_is_better"] else max
+            results[metric]["value"] = better(results[metric]["value"], r["value"])
+
+def find_regressions(base, current, threshold):
+    """Compare against the baseline; return (metric, old, new, enforced) for each regression.
+
+    `enforced` is False while the metric has fewer than BASELINE_RUNS saved values.
+    """
+    regressions = []
+    for metric, cur in current.items():
+        if metric not in base or not base[metric][0]:
+            continue
+        old, mad, count = base[metric]
+        worse = cur["value"] - old if cur["lower_is_better"] else old - cur["value"]
+        if worse > threshold * old and worse > NOISE_MADS * mad:
+            regressions.append((metric, old, cur["value"], count >= BASELINE_RUNS))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the week1 opcode tools and cocotb tests.")
+    parser.add_argument("-s", "--scale", type=int, action="append",
+                        help="Synthetic tree size as a multiple of upstream (default: 1, 10, 100)")
+    parser.add_argument("-n", "--repeat", type=int, default=10, help="Samples per measurement (best is kept)")
+    parser.add_argument("-t", "--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed slowdown vs. the baseline before failing (0.2 = 20%%)")
+    parser.add_argument("--history", default=HISTORY_JSON, help="JSON history file")
+    parser.add_argument("--no-save", action="store_true", help="Don't append this run to the history")
+    parser.add_argument("--accept", action="store_true",
+                        help="Save this run even if it regressed (e.g. an intended slowdown)")
+    args = parser.parse_args()
+
+    results, failures = run(args.scale or SCALES, args.repeat)
+
+    print(f"{'Benchmark':<45} | Value")
+    print("-" * 65)
+    for metric, r in results.items():
+        print(f"{metric:<45} | {r['value']:.6g} {r['unit']}")
+    if not cocotb_available():
+        print("\nSkipped cocotb tests: cocotb-config or iverilog not found")
+    for failure in failures:
+        print(f"\nFAILED: {failure}")
+
+    history = load_history(args.history)
+    base = baseline(history)
+    regressions = find_regressions(base, results, args.threshold)
+    if any(enforced for *_, enforced in regressions):
+        print("\nRe-measuring possible regressions...")
+        confirm(results, regressions, args.repeat)
+        regressions = find_regressions(base, results, args.threshold)
+    if regressions:
+        print(f"\nRegressions (> {args.threshold:.0%} worse than median of last {BASELINE_RUNS} runs):")
+        for metric, old, new, enforced in regressions:
+            note = "" if enforced else f" (not enforced: fewer than {BASELINE_RUNS} saved runs)"
+            print(f"  {metric}: {old:.6g} -> {new:.6g}{note}")
+
+    failed = bool(failures or any(enforced for *_, enforced in regressions))
+    if args.no_save:
+        pass
+    elif failed and not args.accept:
+        print("\nRun not saved to history (use --accept to save it anyway)")
+    else:
+        history.append({
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "commit": git_commit(),
+            "results": results,
+        })
+        with open(args.history, "w", encoding="utf-8") as f:
+            json.dump(history, f, indent=2)
+        print(f"\nResults saved to {args.history}")
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
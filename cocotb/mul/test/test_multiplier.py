@@ -7,6 +7,7 @@ async def multiplier_test(dut):
     """Test for a 4-bit multiplier."""
 
     dut._log.info("Starting multiplier test")
+    vectors = 0
 
     # Define a few specific test cases
     test_cases = [
@@ -25,6 +26,7 @@ async def multiplier_test(dut):
         dut.b.value = b_val
 
         await Timer(1, unit="ns") # Wait for combinational logic to settle
+        vectors += 1
 
         actual_p = dut.p.value
         assert actual_p == expected_p, \
@@ -43,10 +45,12 @@ async def multiplier_test(dut):
         dut.b.value = b_val
 
         await Timer(1, unit="ns")
+        vectors += 1
 
         actual_p = dut.p.value
         assert actual_p == expected_p, \
             f"Random test failed for {a_val} * {b_val}: Expected {expected_p}, got {actual_p}"
         dut._log.info(f"PASS: {a_val} * {b_val} = {actual_p}")
 
+    dut._log.info(f"{vectors} vectors checked")
     dut._log.info("All multiplier tests passed!")
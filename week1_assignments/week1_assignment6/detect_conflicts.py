@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+import argparse
+import os
+import sys
+import json
+from collections import defaultdict
+
+OUTPUT_JSON = "conflicts.json"
+
+# Fields used to bucket encodings, tried in order. Two encodings that both
+# fix a field to different values can never overlap, so they never need to
+# be compared against each other. The 32-bit fields come first; 15..13 is
+# rs1 there, so it only splits compressed encodings and goes last.
+BUCKET_FIELDS = [
+    (1, 0),     # quadrant (3 for 32-bit, 0..2 for compressed)
+    (6, 2),     # major opcode
+    (14, 12),   # funct3
+    (31, 25),   # funct7
+    (15, 13),   # compressed funct3
+]
+
+def parse_field_val(v):
+    """Same rules as list_combinations.parse_val: 0x is hex, anything else decimal."""
+    if v.startswith("0x") or v.startswith("0X"):
+        return int(v, 16)
+    return int(v)
+
+def field_mask(hi, lo):
+    return ((1 << (hi - lo + 1)) - 1) << lo
+
+def parse_encoding(parts):
+    """Build (mask, match) from the 'hi..lo=val' / 'bit=val' tokens of a line.
+
+    Fields set to 'ignore' are don't-care bits and stay out of the mask.
+    Raises ValueError on a malformed field, since dropping just that field
+    would widen the encoding and report false conflicts.
+    """
+    mask = match = 0
+    for p in parts:
+        if "=" not in p:
+            continue
+        bits, val = p.split("=", 1)
+        if ".." in bits:
+            hi, lo = (int(b) for b in bits.split(".."))
+        else:
+            hi = lo = int(bits)
+        if val == "ignore":
+            continue
+        val = parse_field_val(val)
+        if val < 0 or val >> (hi - lo + 1):
+            raise ValueError(f"value {val} does not fit in {bits}")
+        mask |= field_mask(hi, lo)
+        match |= val << lo
+    return mask, match
+
+def parse_file(fpath, include_pseudo=False):
+    """Return encoding records for every instruction defined in one file."""
+    fname = os.path.basename(fpath)
+    encodings = []
+    with open(fpath, "r", encoding="utf-8", errors="ignore") as f:
+        for i, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+
+            parts = line.split()
+            if parts[0].startswith("$import"):
+                continue
+            if parts[0].startswith("$pseudo_op"):
+                if not include_pseudo or len(parts) < 3:
+                    continue
+                # Pseudo-ops belong to the extension they alias, not the file.
+                ext = parts[1].split("::")[0].upper()
+                mnemonic = parts[2]
+                fields = parts[3:]
+            else:
+                ext = fname.upper()
+                mnemonic = parts[0]
+                fields = parts[1:]
+
+            try:
+                mask, match = parse_encoding(fields)
+            except ValueError as err:
+                print(f"warning: {fpath}:{i}: skipping {mnemonic}: {err}", file=sys.stderr)
+                continue
+            if not mask:
+                continue
+            encodings.append({
+                "extension": ext,
+                "filename": fname,
+                "line_number": i,
+                "mnemonic": mnemonic,
+                "mask": mask,
+                "match": match,
+            })
+    return encodings
+
+def collect_encodings(repo_path, include_pseudo=False):
+    encodings = []
+    for d in ("opcodes", "extensions"):
+        dir_path = os.path.join(repo_path, d)
+        if not os.path.isdir(dir_path):
+            continue
+        for fname in sorted(os.listdir(dir_path)):
+            fpath = os.path.join(dir_path, fname)
+            if os.path.isfile(fpath):
+                encodings.extend(parse_file(fpath, include_pseudo))
+    return encodings
+
+def overlaps(a, b):
+    """Two encodings overlap if they agree on every bit both of them fix."""
+    return ((a["match"] ^ b["match"]) & a["mask"] & b["mask"]) == 0
+
+def xlen(e):
+    """32 or 64 for RV32-only / RV64-only extensions, None otherwise."""
+    if e["extension"].startswith("RV32"):
+        return 32
+    if e["extension"].startswith("RV64"):
+        return 64
+    return None
+
+def same_xlen(a, b):
+    """False for an RV32-only / RV64-only pair, which may reuse encodings on purpose."""
+    return xlen(a) is None or xlen(b) is None or xlen(a) == xlen(b)
+
+def _partition(encodings, field):
+    """Split encodings into buckets keyed on a fully fixed field, plus wildcards."""
+    fmask = field_mask(*field)
+    buckets = defaultdict(list)
+    wildcards = []
+    for e in encodings:
+        if e["mask"] & fmask == fmask:
+            buckets[e["match"] & fmask].append(e)
+        else:
+            wildcards.append(e)
+    return buckets, wildcards
+
+def _pairs_within(encodings, fields, pairs):
+    """Find overlapping pairs inside one group, bucketing on each field in turn.
+
+    Encodings that leave a field (partly) unfixed are wildcards: they can
+    overlap any bucket, so they are matched against every bucket, but they
+    are still split on the remaining fields rather than compared all-pairs.
+    """
+    if len(encodings) < 2:
+        return
+    if not fields:
+        for i, a in enumerate(encodings):
+            for b in encodings[i + 1:]:
+                if overlaps(a, b):
+                    pairs.append((a, b))
+        return
+
+    buckets, wildcards = _partition(encodings, fields[0])
+    for bucket in buckets.values():
+        _pairs_within(bucket, fields[1:], pairs)
+    _pairs_within(wildcards, fields[1:], pairs)
+    for bucket in buckets.values():
+        _pairs_between(wildcards, bucket, fields[1:], pairs)
+
+def _pairs_between(left, right, fields, pairs):
+    """Find overlapping (left, right) pairs between two disjoint groups."""
+    if not left or not right:
+        return
+    if not fields:
+        for a in left:
+            for b in right:
+                if overlaps(a, b):
+                    pairs.append((a, b))
+        return
+
+    left_buckets, left_wild = _partition(left, fields[0])
+    right_buckets, right_wild = _partition(right, fields[0])
+    for key, bucket in left_buckets.items():
+        if key in right_buckets:
+            _pairs_between(bucket, right_buckets[key], fields[1:], pairs)
+    _pairs_between(left_wild, right, fields[1:], pairs)
+    left_fixed = [e for bucket in left_buckets.values() for e in bucket]
+    _pairs_between(left_fixed, right_wild, fields[1:], pairs)
+
+def find_conflicts(encodings, fields=BUCKET_FIELDS, include_xlen=False):
+    """Return every pair of encodings that can decode the same instruction word.
+
+    RV32-only vs RV64-only pairs are left out unless include_xlen is set.
+    """
+    pairs = []
+    _pairs_within(encodings, list(fields), pairs)
+    if not include_xlen:
+        pairs = [(a, b) for a, b in pairs if same_xlen(a, b)]
+    return pairs
+
+def source(e):
+    return (e["filename"], e["line_number"])
+
+def to_record(e):
+    return {
+        "extension": e["extension"],
+        "filename": e["filename"],
+        "line_number": e["line_number"],
+        "mnemonic": e["mnemonic"],
+        "mask": f"0x{e['mask']:08x}",
+        "match": f"0x{e['match']:08x}",
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Detect overlapping RISC-V instruction encodings.")
+    parser.add_argument("-o", "--output", default=OUTPUT_JSON, help="Output JSON file")
+    parser.add_argument("--repo-path", default=".", help="Path to riscv-opcodes repo")
+    parser.add_argument("-p", "--include-pseudo", action="store_true",
+                        help="Also check $pseudo_op lines (these alias real instructions by design)")
+    parser.add_argument("-x", "--include-xlen", action="store_true",
+                        help="Also report RV32-only vs RV64-only pairs (never enabled together)")
+    args = parser.parse_args()
+
+    encodings = collect_encodings(args.repo_path, include_pseudo=args.include_pseudo)
+    pairs = [tuple(sorted(p, key=source))
+             for p in find_conflicts(encodings, include_xlen=args.include_xlen)]
+    pairs.sort(key=lambda p: (source(p[0]), source(p[1])))
+
+    conflicts = [{"first": to_record(a), "second": to_record(b)} for a, b in pairs]
+    for a, b in pairs:
+        print(f"{a['mnemonic']} ({a['extension']} {a['filename']}:{a['line_number']}) <-> "
+              f"{b['mnemonic']} ({b['extension']} {b['filename']}:{b['line_number']})")
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(conflicts, f, indent=2)
+
+    print(f"Checked {len(encodings)} encodings, found {len(conflicts)} conflicts. "
+          f"Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()